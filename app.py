@@ -1,10 +1,18 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 import os
 import time
 import re
+import math
+import hashlib
 import logging
-from collections import Counter
+import threading
+from collections import ChainMap, Counter, OrderedDict
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
 import json
 from datetime import datetime
 
@@ -30,17 +38,7 @@ def safe_import(module_name, fallback_message=None):
 
 nltk = safe_import('nltk', "Text processing will use basic fallbacks without NLTK")
 
-if nltk:
-    try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            logger.info("Downloaded NLTK data successfully")
-        except Exception as e:
-            logger.warning(f"Failed to download NLTK data: {e}")
+orjson = safe_import('orjson', "JSON responses will use the standard library encoder")
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -52,149 +50,243 @@ CORS(app,
      methods=['GET', 'POST', 'OPTIONS'],
      allow_headers=['Content-Type'])
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster response serialization"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
+if orjson:
+    app.json = ORJSONProvider(app)
+
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', os.urandom(24).hex())
 
+MAX_TEXT_LENGTH = 100000  # 100KB text limit
+_ALGORITHMS = frozenset({'frequency', 'position', 'hybrid'})
+_EXPORT_FORMATS = frozenset({'txt', 'md', 'json'})
+# Reject oversized bodies before Werkzeug buffers them; sized for the worst case of
+# percent-encoded 4-byte UTF-8 characters (12 bytes each) plus form overhead
+app.config['MAX_CONTENT_LENGTH'] = MAX_TEXT_LENGTH * 12 + 64 * 1024
+
+# Precompiled patterns used on the summarization path
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_WORD4_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_WS_RE = re.compile(r'\s+')
+
+# Common words filtered out of keywords when NLTK stopwords are unavailable
+_COMMON_WORDS = frozenset({'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'can', 'still', 'should', 'after', 'being', 'now', 'made', 'before', 'here', 'through', 'when', 'where', 'much', 'some', 'these', 'many', 'would', 'there'})
+
+def load_stopwords():
+    """Load the English stopword list once, falling back to common words"""
+    if nltk:
+        try:
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words('english'))
+        except LookupError:
+            logger.warning("NLTK stopwords data not found; using built-in common words")
+    return _COMMON_WORDS
+
+_STOPWORDS = load_stopwords()
+
+def load_sentence_tokenizer():
+    """Load the Punkt sentence tokenizer once, or None to use the regex splitter"""
+    if nltk:
+        try:
+            # NLTK 3.8.2+ rebuilds PunktTokenizer on every sent_tokenize call, so keep one instance
+            punkt_tokenizer = getattr(nltk.tokenize, 'PunktTokenizer', None)
+            if punkt_tokenizer:
+                return punkt_tokenizer('english')
+            return nltk.data.load('tokenizers/punkt/english.pickle')
+        except LookupError:
+            logger.warning("NLTK punkt data not found; using regex sentence splitting")
+    return None
+
+_SENT_TOK = load_sentence_tokenizer()
+
 def extract_keywords(text, num_keywords=10):
     """Extract key words from text with fallback"""
     try:
-        if not nltk:
-            # Simple fallback without NLTK
-            words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-            word_freq = Counter(words)
-            # Filter out common words manually
-            common_words = {'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'can', 'still', 'should', 'after', 'being', 'now', 'made', 'before', 'here', 'through', 'when', 'where', 'much', 'some', 'these', 'many', 'would', 'there'}
-            filtered_words = {word: freq for word, freq in word_freq.items() if word not in common_words}
-            return [word for word, freq in Counter(filtered_words).most_common(num_keywords)]
-        
-        from nltk.corpus import stopwords
-        from nltk.tokenize import word_tokenize
-        
-        stop_words = set(stopwords.words('english'))
-        words = [w.lower() for w in word_tokenize(text) if w.isalnum() and w.lower() not in stop_words and len(w) > 3]
-        word_freq = Counter(words)
-        return [word for word, freq in word_freq.most_common(num_keywords)]
+        word_freq = Counter(map(re.Match.group, _WORD4_RE.finditer(text.lower())))
+        # Filter out NLTK stopwords, or the built-in common words without NLTK
+        filtered = ((word, freq) for word, freq in word_freq.items() if word not in _STOPWORDS)
+        return [word for word, freq in nlargest(num_keywords, filtered, key=itemgetter(1))]
         
     except Exception as e:
         logger.warning(f"Keyword extraction failed: {e}")
         return []
 
-def basic_sentence_split(text):
-    """Basic sentence splitting without NLTK"""
+def basic_sentence_spans(text):
+    """Basic sentence splitting without NLTK, as (start, end) offsets"""
     # Simple sentence splitting on periods, exclamation marks, and question marks
-    sentences = re.split(r'[.!?]+', text)
-    return [s.strip() for s in sentences if s.strip()]
-
-def advanced_summarize(text, max_sentences=3, algorithm='frequency'):
-    """Enhanced summarization with multiple algorithms and fallbacks"""
+    bounds = [(m.start(), m.end()) for m in _SENT_SPLIT_RE.finditer(text)]
+    bounds.append((len(text), len(text)))
+    spans = []
+    start = 0
+    for end, next_start in bounds:
+        segment = text[start:end]
+        stripped = segment.strip()
+        if stripped:
+            offset = start + len(segment) - len(segment.lstrip())
+            spans.append((offset, offset + len(stripped)))
+        start = next_start
+    return spans
+
+def sentence_spans(text):
+    """Return (start, end) offsets of each sentence in text"""
+    if _SENT_TOK:
+        return list(_SENT_TOK.span_tokenize(text))
+    return basic_sentence_spans(text)
+
+def tokenize_by_sentence(text, spans):
+    """Lowercase text once and tokenize each sentence span of it"""
+    low = text.lower()
+    if len(low) != len(text):
+        # A few case mappings (e.g. 'İ') change length and would shift the spans
+        return [_WORD_RE.findall(text[start:end].lower()) for start, end in spans]
+    # Bounded findall scans the shared lowercase buffer without slicing it
+    return [_WORD_RE.findall(low, start, end) for start, end in spans]
+
+def frequency_scores(sentence_words, freq):
+    """Sum the word frequencies of each sentence"""
+    # map() over the bound lookup keeps the per-token loop in C
+    lookup = freq.__getitem__
+    return [sum(map(lookup, tokens)) for tokens in sentence_words]
+
+def position_scores(total):
+    """Score every sentence position at once: first/last 3, early 2, rest 1"""
+    # idx < total * 0.3 holds exactly for the first ceil(total * 0.3) indices
+    early = math.ceil(total * 0.3)
+    scores = [2] * early + [1] * (total - early)
+    if scores:
+        scores[0] = scores[-1] = 3
+    return scores
+
+def word_count(text):
+    """Count words in whitespace-normalized text without splitting it"""
+    return text.count(' ') + 1 if text else 0
+
+def summarize_text(text, max_sentences=3, algorithm='frequency'):
+    """Summarize text with the chosen algorithm, plus word counts; raises on failure"""
     if not text or not text.strip():
-        return "No content to summarize.", []
+        summary = "No content to summarize."
+        return summary, [], 0, word_count(summary)
     
-    try:
-        # Ensure text is a string and clean it
-        text = str(text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # If text is too short, just return it
-        if len(text.split()) < 5:
-            return text, extract_keywords(text)
-        
-        # Get sentences
-        if nltk:
-            from nltk.tokenize import sent_tokenize
-            sentences = sent_tokenize(text)
-        else:
-            sentences = basic_sentence_split(text)
+    # Ensure text is a string
+    text = str(text)
+    
+    # If text is too short, just return it; the bounded split stops after
+    # a few words, so long inputs skip straight to normalization
+    head = text.split(maxsplit=5)
+    if len(head) < 5:
+        text = ' '.join(head)
+        return text, extract_keywords(text), len(head), len(head)
+    
+    # Clean whitespace
+    text = _WS_RE.sub(' ', text).strip()
+    original_words = word_count(text)
+    truncated = text[:200] + "..." if len(text) > 200 else text
+    
+    # Get sentences
+    spans = sentence_spans(text)
+    sentences = [text[start:end] for start, end in spans]
+    
+    if len(sentences) <= 1:
+        return truncated, extract_keywords(text), original_words, word_count(truncated)
+    
+    # Extract keywords first
+    keywords = extract_keywords(text)
+    
+    if algorithm == 'frequency':
+        # Frequency-based summarization
+        sentence_words = tokenize_by_sentence(text, spans)
+        freq = Counter(chain.from_iterable(sentence_words))
         
-        if len(sentences) <= 1:
-            return (text[:200] + "..." if len(text) > 200 else text), extract_keywords(text)
+        if not freq:
+            return truncated, keywords, original_words, word_count(truncated)
         
-        # Extract keywords first
-        keywords = extract_keywords(text)
+        # Score sentences
+        sentence_scores = frequency_scores(sentence_words, freq)
         
-        if algorithm == 'frequency':
-            # Frequency-based summarization
-            if nltk:
-                from nltk.tokenize import word_tokenize
-                from nltk import FreqDist
-                words = [w for w in word_tokenize(text.lower()) if w.isalnum()]
-            else:
-                words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-            
-            if not words:
-                return (text[:200] + "..." if len(text) > 200 else text), keywords
-            
-            if nltk:
-                freq = FreqDist(words)
-            else:
-                freq = Counter(words)
-            
-            # Score sentences
-            sentence_scores = []
-            for sentence in sentences:
-                if nltk:
-                    sentence_words = [w.lower() for w in word_tokenize(sentence) if w.isalnum()]
-                else:
-                    sentence_words = re.findall(r'\b[a-zA-Z]+\b', sentence.lower())
-                
-                score = sum(freq.get(w, 0) for w in sentence_words)
-                sentence_scores.append((sentence, score))
-            
-            ranked_sentences = sorted(sentence_scores, key=lambda x: x[1], reverse=True)
-            
-        elif algorithm == 'position':
-            # Position-based summarization
-            def position_score(idx, total):
-                if idx == 0 or idx == total - 1:  # First or last
-                    return 3
-                elif idx < total * 0.3:  # Early sentences
-                    return 2
-                else:
-                    return 1
-            
-            ranked_sentences = [(sent, position_score(i, len(sentences))) for i, sent in enumerate(sentences)]
-            ranked_sentences = sorted(ranked_sentences, key=lambda x: x[1], reverse=True)
+    elif algorithm == 'position':
+        # Position-based summarization
+        sentence_scores = position_scores(len(sentences))
+    
+    else:  # hybrid approach
+        # Combine frequency and position scoring
+        sentence_words = tokenize_by_sentence(text, spans)
+        freq_scores = frequency_scores(sentence_words, Counter(chain.from_iterable(sentence_words)))
+        pos_scores = position_scores(len(sentences))
         
-        else:  # hybrid approach
-            # Combine frequency and position scoring
-            if nltk:
-                from nltk.tokenize import word_tokenize
-                from nltk import FreqDist
-                words = [w for w in word_tokenize(text.lower()) if w.isalnum()]
-                freq = FreqDist(words) if words else {}
-            else:
-                words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-                freq = Counter(words) if words else {}
-            
-            def hybrid_score(sent, idx, total):
-                if nltk:
-                    sentence_words = [w.lower() for w in word_tokenize(sent) if w.isalnum()]
-                else:
-                    sentence_words = re.findall(r'\b[a-zA-Z]+\b', sent.lower())
-                
-                freq_score = sum(freq.get(w, 0) for w in sentence_words)
-                pos_score = 3 if idx == 0 or idx == total - 1 else (2 if idx < total * 0.3 else 1)
-                return freq_score + pos_score
+        sentence_scores = [f + p for f, p in zip(freq_scores, pos_scores)]
+    
+    # Get top sentences by index while preserving order
+    top_idx = sorted(nlargest(max_sentences, range(len(sentence_scores)), key=sentence_scores.__getitem__))
+    important_sentences = [sentences[i] for i in top_idx]
             
-            ranked_sentences = [(sent, hybrid_score(sent, i, len(sentences))) for i, sent in enumerate(sentences)]
-            ranked_sentences = sorted(ranked_sentences, key=lambda x: x[1], reverse=True)
-        
-        # Get top sentences while preserving order
-        top_sentences = [sent for sent, score in ranked_sentences[:max_sentences]]
-        important_sentences = []
-        for sentence in sentences:
-            if sentence in top_sentences:
-                important_sentences.append(sentence)
-                
-        summary = ' '.join(important_sentences)
-        return (summary if summary.strip() else text[:200] + "..." if len(text) > 200 else text), keywords
-        
+    summary = ' '.join(important_sentences)
+    if not summary.strip():
+        summary = truncated
+    return summary, keywords, original_words, word_count(summary)
+
+def fallback_summarize(text, max_sentences=3):
+    """Fallback when summarization fails: return the first few sentences"""
+    text = _WS_RE.sub(' ', str(text)).strip()
+    sentences = text.split('.')
+    fallback_summary = '.'.join(sentences[:max_sentences]) + '.'
+    return fallback_summary, extract_keywords(text), len(text.split()), len(fallback_summary.split())
+
+def advanced_summarize(text, max_sentences=3, algorithm='frequency'):
+    """Enhanced summarization with multiple algorithms and fallbacks, plus word counts"""
+    try:
+        return summarize_text(text, max_sentences, algorithm)
+    except Exception as e:
+        logger.error(f"Error in summarization: {e}")
+        return fallback_summarize(text, max_sentences)
+
+# LRU cache of summaries keyed by a digest of the input, so large texts are not kept alive as keys
+_SUMMARY_CACHE = OrderedDict()
+_SUMMARY_CACHE_SIZE = 1024
+_SUMMARY_CACHE_MAX_CHARS = 4096  # Summaries longer than this are not cached, bounding the cache to a few MB
+_summary_cache_lock = threading.Lock()
+
+def cached_summarize(text, max_sentences=3, algorithm='frequency'):
+    """Summarize with successful results cached for repeated identical requests"""
+    digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    key = (digest, max_sentences, algorithm)
+    with _summary_cache_lock:
+        result = _SUMMARY_CACHE.get(key)
+        if result is not None:
+            _SUMMARY_CACHE.move_to_end(key)
+            return result
+    
+    try:
+        result = summarize_text(text, max_sentences, algorithm)
     except Exception as e:
+        # Degraded fallback output is returned but never cached
         logger.error(f"Error in summarization: {e}")
-        # Fallback: return first few sentences
-        sentences = text.split('.')
-        fallback_summary = '.'.join(sentences[:max_sentences]) + '.'
-        return fallback_summary, extract_keywords(text)
+        return fallback_summarize(text, max_sentences)
+    if len(result[0]) > _SUMMARY_CACHE_MAX_CHARS:
+        return result
+    with _summary_cache_lock:
+        _SUMMARY_CACHE[key] = result
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+    return result
 
 @app.route('/')
 def serve_frontend():
@@ -227,23 +319,13 @@ def summarize():
     start_time = time.time()
     logger.info("Received summarize request")
 
+    # CORS headers for preflight and actual responses come from flask-cors
     if request.method == 'OPTIONS':
-        response = jsonify({'status': 'ok'})
-        response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', '*'))
-        response.headers.add('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
-        return response
+        return jsonify({'status': 'ok'})
 
     try:
         algorithm = request.form.get('algorithm', 'frequency')
         max_sentences = int(request.form.get('max_sentences', 3))
-        
-        # Validate parameters
-        if algorithm not in ['frequency', 'position', 'hybrid']:
-            algorithm = 'frequency'
-        if max_sentences < 1 or max_sentences > 10:
-            max_sentences = 3
-
         text = None
         
         # Check for text input
@@ -252,9 +334,15 @@ def summarize():
         elif request.is_json:
             data = request.get_json()
             text = data.get('text')
-            algorithm = data.get('algorithm', 'frequency')
+            algorithm = str(data.get('algorithm', 'frequency'))
             max_sentences = int(data.get('max_sentences', 3))
 
+        # Validate parameters
+        if algorithm not in _ALGORITHMS:
+            algorithm = 'frequency'
+        if max_sentences < 1 or max_sentences > 10:
+            max_sentences = 3
+
         if text is None:
             return jsonify({'error': 'No text provided'}), 400
 
@@ -262,14 +350,12 @@ def summarize():
         if not text:
             return jsonify({'error': 'Empty text provided'}), 400
         
-        if len(text) > 100000:  # 100KB text limit
+        if len(text) > MAX_TEXT_LENGTH:
             return jsonify({'error': 'Text too long. Please limit to 100,000 characters.'}), 400
         
         logger.info(f"Text input received: {len(text)} characters")
-        summary, keywords = advanced_summarize(text, max_sentences, algorithm)
+        summary, keywords, original_length, summary_length = cached_summarize(text, max_sentences, algorithm)
         processing_time = int((time.time() - start_time) * 1000)
-        original_length = len(text.split())
-        summary_length = len(summary.split())
         compression_ratio = int((1 - (summary_length / original_length)) * 100) if original_length > 0 else 0
 
         response_data = {
@@ -282,37 +368,81 @@ def summarize():
             'algorithm_used': algorithm
         }
 
-        response = jsonify(response_data)
-        response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', '*'))
-        return response
+        return jsonify(response_data)
 
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error in summarize endpoint: {e}")
-        error_response = jsonify({'error': f'Server error: {str(e)}'})
-        error_response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', '*'))
-        return error_response, 500
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+# Sample texts are constant, so encode their JSON bodies once at import
+_SAMPLES = [
+    {
+        'title': 'Artificial Intelligence Revolution',
+        'text': "Artificial intelligence (AI) is revolutionizing the way we work, live, and interact with technology. From machine learning algorithms that can predict consumer behavior to natural language processing systems that can understand and respond to human speech, AI is transforming industries across the globe. In healthcare, AI is being used to diagnose diseases more accurately and develop personalized treatment plans. In finance, AI algorithms are detecting fraud and making investment decisions. In transportation, autonomous vehicles powered by AI are becoming a reality. As AI continues to evolve, it promises to bring even more innovative solutions to complex problems, making our lives more efficient and productive."
+    },
+    {
+        'title': 'Climate Change Challenge',
+        'text': "Climate change represents one of the most pressing challenges of our time, with far-reaching implications for ecosystems, human societies, and the global economy. Rising global temperatures, caused primarily by greenhouse gas emissions from human activities, are leading to more frequent and severe weather events, including hurricanes, droughts, and floods. The melting of polar ice caps and glaciers is contributing to rising sea levels, threatening coastal communities worldwide. To address this crisis, governments, businesses, and individuals must work together to reduce carbon emissions, transition to renewable energy sources, and implement sustainable practices. The Paris Agreement represents a significant step forward in global climate action, but much more needs to be done to limit global warming and protect our planet for future generations."
+    },
+    {
+        'title': 'Future of Remote Work',
+        'text': "The COVID-19 pandemic has fundamentally transformed the way we think about work, accelerating the adoption of remote work practices across industries. Companies that once required physical presence have discovered that many tasks can be performed effectively from home, leading to increased flexibility and work-life balance for employees. This shift has also opened up new opportunities for businesses to access global talent pools and reduce overhead costs associated with maintaining large office spaces. However, remote work also presents challenges, including the need for robust digital infrastructure, effective communication tools, and strategies to maintain team cohesion and company culture. As we move forward, hybrid work models that combine remote and in-office work are likely to become the new standard, requiring organizations to adapt their management practices and invest in technology that supports distributed teams."
+    }
+]
+_SAMPLE_JSON = [json.dumps(sample).encode('utf-8') for sample in _SAMPLES]
 
 @app.route('/api/sample', methods=['GET'])
 def get_sample_text():
     """Return sample text for demonstration"""
-    samples = [
-        {
-            'title': 'Artificial Intelligence Revolution',
-            'text': "Artificial intelligence (AI) is revolutionizing the way we work, live, and interact with technology. From machine learning algorithms that can predict consumer behavior to natural language processing systems that can understand and respond to human speech, AI is transforming industries across the globe. In healthcare, AI is being used to diagnose diseases more accurately and develop personalized treatment plans. In finance, AI algorithms are detecting fraud and making investment decisions. In transportation, autonomous vehicles powered by AI are becoming a reality. As AI continues to evolve, it promises to bring even more innovative solutions to complex problems, making our lives more efficient and productive."
-        },
-        {
-            'title': 'Climate Change Challenge',
-            'text': "Climate change represents one of the most pressing challenges of our time, with far-reaching implications for ecosystems, human societies, and the global economy. Rising global temperatures, caused primarily by greenhouse gas emissions from human activities, are leading to more frequent and severe weather events, including hurricanes, droughts, and floods. The melting of polar ice caps and glaciers is contributing to rising sea levels, threatening coastal communities worldwide. To address this crisis, governments, businesses, and individuals must work together to reduce carbon emissions, transition to renewable energy sources, and implement sustainable practices. The Paris Agreement represents a significant step forward in global climate action, but much more needs to be done to limit global warming and protect our planet for future generations."
-        },
-        {
-            'title': 'Future of Remote Work',
-            'text': "The COVID-19 pandemic has fundamentally transformed the way we think about work, accelerating the adoption of remote work practices across industries. Companies that once required physical presence have discovered that many tasks can be performed effectively from home, leading to increased flexibility and work-life balance for employees. This shift has also opened up new opportunities for businesses to access global talent pools and reduce overhead costs associated with maintaining large office spaces. However, remote work also presents challenges, including the need for robust digital infrastructure, effective communication tools, and strategies to maintain team cohesion and company culture. As we move forward, hybrid work models that combine remote and in-office work are likely to become the new standard, requiring organizations to adapt their management practices and invest in technology that supports distributed teams."
-        }
-    ]
-    
-    sample = samples[int(time.time()) % len(samples)]  # Rotate samples based on time
-    response = jsonify(sample)
-    return response
+    idx = int(time.time()) % len(_SAMPLE_JSON)  # Rotate samples based on time
+    return Response(_SAMPLE_JSON[idx], mimetype='application/json')
+
+# Export report templates, filled from the request with format_map()
+_EXPORT_STAT_DEFAULTS = {
+    'original_length': 'N/A',
+    'summary_length': 'N/A',
+    'compression_ratio': 'N/A',
+    'processing_time': 'N/A'
+}
+
+_MD_TEMPLATE = """# Summary Report
+Generated on: {timestamp}
+
+## Summary
+{summary}
+
+## Keywords
+{keywords}
+
+## Statistics
+- Original Length: {original_length} words
+- Summary Length: {summary_length} words
+- Compression Ratio: {compression_ratio}%
+- Processing Time: {processing_time}ms
+
+---
+*Generated by Summify Text-Only v3.0*
+"""
+
+_TXT_TEMPLATE = """SUMMARY REPORT
+Generated on: {timestamp}
+
+SUMMARY:
+{summary}
+
+KEYWORDS:
+{keywords}
+
+STATISTICS:
+Original Length: {original_length} words
+Summary Length: {summary_length} words
+Compression Ratio: {compression_ratio}%
+Processing Time: {processing_time}ms
+
+Generated by Summify Text-Only v3.0
+"""
 
 @app.route('/api/export', methods=['POST'])
 def export_summary():
@@ -325,9 +455,9 @@ def export_summary():
         summary = data.get('summary', '')
         keywords = data.get('keywords', [])
         stats = data.get('stats', {})
-        format_type = data.get('format', 'txt')
+        format_type = str(data.get('format', 'txt'))
         
-        if format_type not in ['txt', 'md', 'json']:
+        if format_type not in _EXPORT_FORMATS:
             return jsonify({'error': 'Invalid format. Supported: txt, md, json'}), 400
         
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -340,49 +470,25 @@ def export_summary():
                 'exported_at': timestamp,
                 'version': '3.0'
             }
-            content = json.dumps(export_data, indent=2)
+            if orjson:
+                content = orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+            else:
+                content = json.dumps(export_data, indent=2)
             mimetype = 'application/json'
             
-        elif format_type == 'md':
-            content = f"""# Summary Report
-Generated on: {timestamp}
-
-## Summary
-{summary}
-
-## Keywords
-{', '.join(keywords) if keywords else 'No keywords extracted'}
-
-## Statistics
-- Original Length: {stats.get('original_length', 'N/A')} words
-- Summary Length: {stats.get('summary_length', 'N/A')} words
-- Compression Ratio: {stats.get('compression_ratio', 'N/A')}%
-- Processing Time: {stats.get('processing_time', 'N/A')}ms
-
----
-*Generated by Summify Text-Only v3.0*
-"""
-            mimetype = 'text/markdown'
+        else:
+            fields = ChainMap({
+                'timestamp': timestamp,
+                'summary': summary,
+                'keywords': ', '.join(keywords) if keywords else 'No keywords extracted'
+            }, stats, _EXPORT_STAT_DEFAULTS)
             
-        else:  # txt format
-            content = f"""SUMMARY REPORT
-Generated on: {timestamp}
-
-SUMMARY:
-{summary}
-
-KEYWORDS:
-{', '.join(keywords) if keywords else 'No keywords extracted'}
-
-STATISTICS:
-Original Length: {stats.get('original_length', 'N/A')} words
-Summary Length: {stats.get('summary_length', 'N/A')} words
-Compression Ratio: {stats.get('compression_ratio', 'N/A')}%
-Processing Time: {stats.get('processing_time', 'N/A')}ms
-
-Generated by Summify Text-Only v3.0
-"""
-            mimetype = 'text/plain'
+            if format_type == 'md':
+                content = _MD_TEMPLATE.format_map(fields)
+                mimetype = 'text/markdown'
+            else:  # txt format
+                content = _TXT_TEMPLATE.format_map(fields)
+                mimetype = 'text/plain'
         
         response = jsonify({
             'content': content,
@@ -391,11 +497,20 @@ Generated by Summify Text-Only v3.0
         })
         return response
         
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         logger.error(f"Export error: {e}")
         response = jsonify({'error': f'Export failed: {str(e)}'})
         return response, 500
 
+@app.errorhandler(413)
+def request_too_large(e):
+    """Handle request bodies over MAX_CONTENT_LENGTH"""
+    logger.warning(f"Request too large: {e}")
+    response = jsonify({'error': 'Request too large. Please limit text to 100,000 characters.'})
+    return response, 413
+
 @app.errorhandler(500)
 def internal_error(e):
     """Handle internal server errors"""
@@ -405,11 +520,6 @@ def internal_error(e):
 
 if __name__ == '__main__':
     logger.info("Starting Summify Text-Only Server v3.0...")
-    # Remove all print statements for cleaner console output
-    try:
-        app.run(debug=True, port=5000, host='0.0.0.0')
-    except Exception as e:
-        logger.error(f"Server startup failed: {e}")
     print(f"Frontend URL: http://127.0.0.1:5500")
     print(f"Status endpoint: http://localhost:5000/api/status")
     print("=" * 50)